@@ -1,5 +1,17 @@
+import logging
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+
+# Configure logging once for the whole application
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+# Flush LangChain callbacks off the response path unless overridden
+os.environ.setdefault("LANGCHAIN_CALLBACKS_BACKGROUND", "true")
+
 from .src.api.routes import router
 
 app = FastAPI(title="DSP Performance Analyzer API")
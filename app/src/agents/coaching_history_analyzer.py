@@ -2,22 +2,27 @@
 Agent for generating structured coaching feedback with historical context.
 """
 
+import asyncio
+import bisect
+import collections
+import functools
+import re
+import sys
+import threading
 import os
 import json
 import logging
-import pandas as pd
 import uuid
 import time
-from typing import Dict, List, Optional, Any, Callable, Set, TypedDict
+from typing import Dict, List, Optional, Any, Callable, Set, TypedDict, TYPE_CHECKING
 from datetime import datetime
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_openai import ChatOpenAI
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.tools import Tool, StructuredTool
-from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
+from langchain_core.messages import HumanMessage, AIMessage, BaseMessage, SystemMessage
 from pydantic import BaseModel, Field
 from langchain.agents import AgentExecutor, create_openai_tools_agent
-from langchain_core.runnables import RunnablePassthrough
+from langchain_core.runnables import RunnableLambda, RunnablePassthrough
 from dotenv import load_dotenv
 from langgraph.graph import StateGraph, END, START
 from langgraph.checkpoint.memory import MemorySaver
@@ -25,18 +30,455 @@ from langgraph.graph.message import add_messages
 from typing_extensions import Annotated
 from ..prompts.coaching_history import COACHING_HISTORY_PROMPT_TEMPLATE_STR
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# pandas and langchain_openai are imported lazily: together they add hundreds
+# of ms of import time and are only needed once an instance is actually built
+if TYPE_CHECKING:
+    import pandas as pd
+    from langchain_openai import ChatOpenAI
+
 logger = logging.getLogger(__name__)
 
+# Column names for the coaching details Excel sheet
+EXCEL_COLUMNS = (
+    "Status",
+    "Date",
+    "Category",
+    "Subcategory",
+    "Severity",
+    "Statement_of_Problem",
+    "Prior_Discussion",
+    "Corrective_Action",
+    "Uploaded_Pictures",
+)
+
+# Lightweight record type: attribute access is faster than per-field dict.get
+# and the tuple layout is cheaper to hold than one dict per row
+CoachingRecord = collections.namedtuple(
+    "CoachingRecord", EXCEL_COLUMNS, defaults=("",) * len(EXCEL_COLUMNS)
+)
+
+
+def _to_record(row: Dict[str, Any]) -> CoachingRecord:
+    """Convert a raw row dict to a CoachingRecord, tolerating missing keys."""
+    return CoachingRecord(*(row.get(field, "") for field in EXCEL_COLUMNS))
+
+
+# Fields drawn from a small fixed vocabulary; interning them collapses the
+# repeated values to shared objects so equality checks are pointer comparisons
+_CATEGORICAL_FIELDS = ("Status", "Category", "Subcategory", "Severity")
+
+
+def _intern_categoricals(record: CoachingRecord) -> CoachingRecord:
+    """Replace categorical field values with interned strings."""
+    replacements = {
+        field: sys.intern(value)
+        for field in _CATEGORICAL_FIELDS
+        if isinstance(value := getattr(record, field), str) and value
+    }
+    return record._replace(**replacements) if replacements else record
+
+
+def _dedupe_records(records: List[CoachingRecord]) -> List[CoachingRecord]:
+    """Drop exact duplicate records, preserving order."""
+    deduped = [_intern_categoricals(record) for record in dict.fromkeys(records)]
+    if len(deduped) < len(records):
+        logger.info(
+            f"Dropped {len(records) - len(deduped)} duplicate coaching records "
+            f"({len(records)} -> {len(deduped)})"
+        )
+    return deduped
+
+
+# Keyword patterns mapping common query phrasings to the canonical severity
+# categories; a local match is effectively free compared to an LLM round trip
+CATEGORY_PATTERNS = {
+    "Speeding Violations": re.compile(r"\bspeed(ing)?\b", re.I),
+    "Hard Braking": re.compile(r"\bhard\s*brak", re.I),
+    "Following Distance": re.compile(r"\bfollowing\s*distance\b", re.I),
+    "Driver Distraction": re.compile(r"\bdistract", re.I),
+    "Sign Violations": re.compile(r"\b(stop\s*sign|sign\s*violation)", re.I),
+    "Traffic Light Violations": re.compile(r"\b(traffic\s*light|red\s*light)", re.I),
+    "Seatbelt Compliance": re.compile(r"\bseat\s*belt", re.I),
+    "Backing": re.compile(r"\bback(ing|ed)\b", re.I),
+    "Idling": re.compile(r"\bidl(ing|e)\b", re.I),
+}
+
+
+# Combined alternation so classification is one pass over the query instead
+# of one scan per category pattern
+_CATEGORY_RE = re.compile(
+    "|".join(
+        f"(?P<c{i}>{pattern.pattern})"
+        for i, pattern in enumerate(CATEGORY_PATTERNS.values())
+    ),
+    re.I,
+)
+_CATEGORY_BY_GROUP = {
+    f"c{i}": category for i, category in enumerate(CATEGORY_PATTERNS)
+}
+
+
+def match_severity_category(query: str) -> Optional[str]:
+    """
+    Classify a coaching query into a known severity category via keywords.
+
+    Args:
+        query: The coaching query text
+
+    Returns:
+        The matched severity category, or None if no pattern matches
+    """
+    match = _CATEGORY_RE.search(query)
+    if not match:
+        return None
+    return next(
+        category
+        for name, category in _CATEGORY_BY_GROUP.items()
+        if match.group(name) is not None
+    )
+
+
+# Shared ChatOpenAI clients keyed by (api_key, model, temperature); the client
+# is thread-safe, so reusing it lets concurrent instances pool HTTP connections
+_LLM_CACHE: Dict[tuple, "ChatOpenAI"] = {}
+_LLM_CACHE_LOCK = threading.Lock()
+
+def _create_checkpointer():
+    """
+    Build the graph checkpointer for this process.
+
+    When CHECKPOINT_DB is set and the optional langgraph-checkpoint-sqlite
+    package is installed, sessions are persisted to SQLite so state survives
+    restarts and can be shared across workers pointing at the same file.
+    Otherwise falls back to the bounded in-memory saver.
+    """
+    checkpoint_db = os.getenv("CHECKPOINT_DB")
+    if checkpoint_db:
+        try:
+            import sqlite3
+
+            from langgraph.checkpoint.sqlite import SqliteSaver
+
+            class _ThreadedSqliteSaver(SqliteSaver):
+                """
+                SqliteSaver whose async interface offloads to a worker thread.
+
+                The stock SqliteSaver raises NotImplementedError from its
+                async methods, which would turn every async entry point
+                (ainvoke, astream_events, abatch) into a 500 whenever
+                CHECKPOINT_DB is set. AsyncSqliteSaver needs a running event
+                loop to establish its aiosqlite connection, which this sync
+                construction path does not have, so instead the sync methods
+                are run in a worker thread; they already serialize on the
+                saver's internal lock over one WAL-mode connection.
+                """
+
+                async def aget_tuple(self, config):
+                    return await asyncio.get_running_loop().run_in_executor(
+                        None, self.get_tuple, config
+                    )
+
+                async def alist(self, config, *, filter=None, before=None, limit=None):
+                    checkpoints = await asyncio.get_running_loop().run_in_executor(
+                        None,
+                        lambda: list(
+                            self.list(config, filter=filter, before=before, limit=limit)
+                        ),
+                    )
+                    for checkpoint in checkpoints:
+                        yield checkpoint
+
+                async def aput(self, config, checkpoint, metadata, new_versions):
+                    return await asyncio.get_running_loop().run_in_executor(
+                        None, self.put, config, checkpoint, metadata, new_versions
+                    )
+
+                async def aput_writes(self, config, writes, task_id):
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, self.put_writes, config, writes, task_id
+                    )
+
+            connection = sqlite3.connect(checkpoint_db, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            logger.info(f"Using SQLite checkpointer at {checkpoint_db}")
+            return _ThreadedSqliteSaver(connection)
+        except ImportError:
+            logger.warning(
+                "CHECKPOINT_DB is set but langgraph-checkpoint-sqlite is not "
+                "installed; falling back to in-memory checkpointing"
+            )
+    return BoundedMemorySaver()
+
+
+class BoundedMemorySaver(MemorySaver):
+    """
+    MemorySaver that evicts the least-recently-used conversation threads.
+
+    The stock MemorySaver keeps every checkpoint for every thread_id forever,
+    so a long-lived server grows its heap with each new session. This bounds
+    the number of retained threads and drops the oldest ones wholesale.
+    """
+
+    def __init__(self, max_threads: int = 1024, **kwargs):
+        super().__init__(**kwargs)
+        self.max_threads = max_threads
+        self._thread_order: "collections.OrderedDict[str, None]" = (
+            collections.OrderedDict()
+        )
+        self._order_lock = threading.Lock()
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        result = super().put(config, checkpoint, metadata, new_versions)
+        thread_id = config["configurable"]["thread_id"]
+        with self._order_lock:
+            self._thread_order[thread_id] = None
+            self._thread_order.move_to_end(thread_id)
+            evicted = []
+            while len(self._thread_order) > self.max_threads:
+                evicted.append(self._thread_order.popitem(last=False)[0])
+        for old_thread in evicted:
+            self.delete_thread(old_thread)
+            logger.debug("Evicted checkpoint history for thread %s", old_thread)
+        return result
+
+
+class SemanticCache:
+    """
+    In-memory semantic cache mapping query embeddings to prior responses.
+
+    Paraphrased repeats of a recent query ("Moises was speeding" vs. "Moises
+    got a speeding ticket") skip the agent round trip entirely when their
+    embedding similarity clears the threshold. Requires the optional
+    sentence-transformers dependency; without it the cache quietly disables
+    itself and every lookup is a miss.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.87, max_entries: int = 1000):
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self._model = None
+        self._unavailable = False
+        # Per-namespace parallel lists of (embedding, response), oldest first
+        self._entries: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def _encode(self, text: str):
+        """Embed text, or return None when the model is unavailable."""
+        if self._unavailable:
+            return None
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                self._unavailable = True
+                logger.info(
+                    "sentence-transformers not installed; semantic cache disabled"
+                )
+                return None
+            self._model = SentenceTransformer("all-MiniLM-L6-v2")
+        return self._model.encode(text, normalize_embeddings=True)
+
+    def get(self, query: str, namespace: str = ""):
+        """
+        Look up a cached response for a semantically similar query.
+
+        Args:
+            query: The query text
+            namespace: Cache namespace (e.g. session ID)
+
+        Returns:
+            Tuple of (cached response or None, query embedding or None); the
+            embedding is returned so a following put() can reuse it
+        """
+        embedding = self._encode(query)
+        if embedding is None:
+            return None, None
+        with self._lock:
+            entries = self._entries.get(namespace)
+            if not entries:
+                return None, embedding
+            import numpy as np
+
+            similarities = np.vstack([e for e, _ in entries]) @ embedding
+            best = int(similarities.argmax())
+            if similarities[best] >= self.similarity_threshold:
+                logger.info(
+                    f"Semantic cache hit (similarity {similarities[best]:.3f})"
+                )
+                return entries[best][1], embedding
+        return None, embedding
+
+    def put(self, embedding, response: str, namespace: str = "") -> None:
+        """Store a response under its query embedding, evicting the oldest."""
+        if embedding is None:
+            return
+        with self._lock:
+            bucket = self._entries.setdefault(namespace, [])
+            bucket.append((embedding, response))
+            if len(bucket) > self.max_entries:
+                bucket.pop(0)
+
+
+@functools.lru_cache(maxsize=8)
+def _render_system_prompt(employee_list: str, severity_categories: str) -> str:
+    """Render the system prompt for a formatted employee/category listing."""
+    return COACHING_HISTORY_PROMPT_TEMPLATE_STR.format(
+        employee_list=employee_list, severity_categories=severity_categories
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _build_prompt(employee_list: str, severity_categories: str) -> ChatPromptTemplate:
+    """
+    Build the agent prompt for a rendered employee/category listing.
+
+    Cached so instances sharing the same employee list reuse one compiled
+    ChatPromptTemplate instead of re-rendering the system prompt and
+    re-validating the template's message models.
+    """
+    system_prompt = _render_system_prompt(employee_list, severity_categories)
+    return ChatPromptTemplate.from_messages(
+        [
+            ("system", system_prompt),
+            MessagesPlaceholder(variable_name="chat_history"),
+            ("human", "{input}"),
+            MessagesPlaceholder(variable_name="agent_scratchpad"),
+        ]
+    )
+
+# Formatted employee lists keyed by (path, mtime, size) of the data file, so
+# repeated inits against an unchanged file skip the sort-and-format entirely
+_EMPLOYEE_LIST_CACHE: Dict[tuple, str] = {}
+
+
+# One sync/async httpx client pair shared by every ChatOpenAI instance, so
+# all model/temperature configurations multiplex over the same keep-alive
+# connection pool instead of each paying fresh TCP+TLS handshakes
+_HTTP_CLIENTS: Optional[tuple] = None
+
+
+def _get_shared_http_clients() -> tuple:
+    """
+    Get (or lazily create) the httpx clients shared by all LLM configs.
+
+    Returns:
+        Tuple of (sync httpx.Client, async httpx.AsyncClient)
+    """
+    global _HTTP_CLIENTS
+    if _HTTP_CLIENTS is None:
+        import httpx
+
+        try:
+            # HTTP/2 multiplexing needs the optional h2 package
+            import h2  # noqa: F401
+
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        limits = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+        _HTTP_CLIENTS = (
+            httpx.Client(http2=http2, limits=limits, timeout=60.0),
+            httpx.AsyncClient(http2=http2, limits=limits, timeout=60.0),
+        )
+    return _HTTP_CLIENTS
+
+
+def _get_shared_llm(
+    api_key: str, model: str = "gpt-4o-mini", temperature: float = 0.2
+) -> "ChatOpenAI":
+    """
+    Get (or lazily create) a shared ChatOpenAI client for the given settings.
+
+    Args:
+        api_key: OpenAI API key
+        model: Model name
+        temperature: Sampling temperature
+
+    Returns:
+        A shared ChatOpenAI instance
+    """
+    from langchain_openai import ChatOpenAI
+
+    cache_key = (api_key, model, temperature)
+    with _LLM_CACHE_LOCK:
+        llm = _LLM_CACHE.get(cache_key)
+        if llm is None:
+            http_client, http_async_client = _get_shared_http_clients()
+            llm = ChatOpenAI(
+                temperature=temperature,
+                api_key=api_key,
+                model=model,
+                http_client=http_client,
+                http_async_client=http_async_client,
+                # Verbose stringifies every multi-KB prompt/response; keep it
+                # off unless explicitly enabled for debugging
+                verbose=os.getenv("LC_VERBOSE") == "1",
+            )
+            _LLM_CACHE[cache_key] = llm
+        return llm
+
+
+def resolve_coaching_data_path() -> str:
+    """
+    Resolve the default coaching data file path.
+
+    Prefers the combined JSON file, then the flat JSON export, then the
+    raw Excel sheet.
+
+    Returns:
+        Path to the coaching data file
+    """
+    coaching_data_path = os.path.join(
+        os.getcwd(), "json_output", "combined_coaching_history.json"
+    )
+    if not os.path.exists(coaching_data_path):
+        coaching_data_path = os.path.join(os.getcwd(), "coaching_history.json")
+        if not os.path.exists(coaching_data_path):
+            coaching_data_path = os.path.join(os.getcwd(), "Coaching Details.xlsx")
+    return coaching_data_path
+
+
+# Canned fallback texts. Node failures are returned as ordinary AIMessage
+# outputs rather than raised, so callers that must recognize a failed run
+# (e.g. the semantic cache) compare against these.
+_ERROR_RESPONSE = (
+    "I'm sorry, I encountered an error while processing your request. "
+    "Please try again with more specific instructions."
+)
+_NO_RESPONSE = "Sorry, I couldn't generate a response."
+
+
+# Keep at most this many messages in graph state per session. Checkpoint
+# size, MemorySaver copy cost, and prompt tokens all grow with history
+# length, so long sessions are capped at the most recent messages.
+_MAX_STATE_MESSAGES = 24
+
+
+def _bounded_add_messages(
+    existing: list[BaseMessage], new: list[BaseMessage]
+) -> list[BaseMessage]:
+    """
+    Message reducer that appends like add_messages but bounds the history.
+
+    Args:
+        existing: Messages already in the graph state
+        new: Messages produced by the current update
+
+    Returns:
+        The merged message list, trimmed to the newest _MAX_STATE_MESSAGES
+    """
+    merged = add_messages(existing, new)
+    if len(merged) > _MAX_STATE_MESSAGES:
+        merged = merged[-_MAX_STATE_MESSAGES:]
+    return merged
+
 
 # Define the state schema for the coaching feedback generator
 class CoachingFeedbackState(TypedDict):
     """State schema for the coaching feedback generator graph."""
 
-    messages: Annotated[list[BaseMessage], add_messages]
+    messages: Annotated[list[BaseMessage], _bounded_add_messages]
     employee_name: Optional[str]
     severity_category: Optional[str]
 
@@ -63,66 +505,123 @@ class CoachingFeedbackGenerator:
 
         # Set default coaching data path if not provided
         if not coaching_data_path:
-            coaching_data_path = os.path.join(
-                os.getcwd(), "json_output", "combined_coaching_history.json"
-            )
-            if not os.path.exists(coaching_data_path):
-                coaching_data_path = os.path.join(os.getcwd(), "coaching_history.json")
-                if not os.path.exists(coaching_data_path):
-                    coaching_data_path = os.path.join(
-                        os.getcwd(), "Coaching Details.xlsx"
-                    )
+            coaching_data_path = resolve_coaching_data_path()
 
         self.coaching_data_path = coaching_data_path
         self.coaching_history = self._load_coaching_data()
-        self.llm = ChatOpenAI(
-            temperature=0.2, api_key=self.api_key, model="gpt-4o-mini"
+        # The container shape is fixed at load time, so resolve it once here
+        # instead of re-checking isinstance on every tool call
+        self._is_by_employee = (
+            isinstance(self.coaching_history, dict)
+            and "records" not in self.coaching_history
+        )
+        self._frames_by_employee = self._build_frame_index()
+        # Fixed-width NumPy view of the severity column per employee; a
+        # np.char.find over it gives the filter mask in one C-level pass
+        self._sev_arr_by_employee = {
+            employee: frame["_sev_lc"].to_numpy(dtype=str)
+            for employee, frame in self._frames_by_employee.items()
+        }
+        self._categories_by_employee = self._build_category_index()
+        # Casefolded view of the category index for case-insensitive matching
+        self._categories_lc_by_employee = {
+            employee: [category.casefold() for category in categories]
+            for employee, categories in self._categories_by_employee.items()
+        }
+
+        # Pre-render the per-employee category listings so looking one up is
+        # a plain dict access at call time
+        self._formatted_categories = {
+            employee: self._render_category_listing(employee)
+            for employee in self._categories_by_employee
+        }
+
+        # Severity categories are deterministic from the loaded data, so they
+        # are baked straight into the system prompt; this saves the agent an
+        # entire LLM turn that would otherwise go to a lookup tool
+        self._severity_categories_block = self._render_severity_categories_block()
+
+        # Memoize the formatted coaching histories; the coaching data is
+        # immutable after load, so a bounded LRU is always correct
+        self._format_coaching_cached = functools.lru_cache(maxsize=2048)(
+            self._format_coaching
         )
-        self.memory = MemorySaver()
-
         # Get the list of employees
         self.employee_list = self._get_employee_list()
 
-        # Create tools
-        self.tools = [
-            StructuredTool.from_function(
-                func=self._list_severity_categories,
-                name="list_severity_categories",
-                description="List all severity categories available for a specific employee",
-                return_direct=True,
-            ),
+        logger.info("Coaching Feedback Generator initialized with LangGraph")
+
+    # The LangChain side of the instance (LLM client, checkpointer, tools,
+    # compiled graph) is built lazily via cached_property: construction stays
+    # cheap for callers that only use the data helpers, and each piece is
+    # still created exactly once per instance on first use.
+
+    @functools.cached_property
+    def llm(self) -> "ChatOpenAI":
+        """The shared ChatOpenAI client for this instance's API key."""
+        return _get_shared_llm(self.api_key)
+
+    @functools.cached_property
+    def memory(self):
+        """Checkpointer: SQLite-backed when CHECKPOINT_DB is set, else a
+        bounded in-memory saver that evicts the oldest threads."""
+        return _create_checkpointer()
+
+    @functools.cached_property
+    def tools(self) -> List[StructuredTool]:
+        """Agent tools. Severity categories live in the system prompt, so no
+        lookup tool (and no extra LLM round trip) is needed for them."""
+        return [
             StructuredTool.from_function(
                 func=self._get_employee_coaching,
                 name="get_employee_coaching",
-                description="Get coaching history for a specific employee and severity category",
+                description="Get coaching history for a specific employee and severity category; pass limit to get only the N most recent records",
+                return_direct=False,
+            ),
+            StructuredTool.from_function(
+                func=self._get_employee_coaching_many,
+                name="get_employee_coaching_many",
+                description="Get coaching history for a specific employee across multiple severity categories in one call",
                 return_direct=False,
             ),
         ]
 
-        # Create the prompt template with employee list
-        self.prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    COACHING_HISTORY_PROMPT_TEMPLATE_STR.format(
-                        employee_list=self.employee_list
-                    ),
-                ),
-                MessagesPlaceholder(variable_name="chat_history"),
-                ("human", "{input}"),
-                MessagesPlaceholder(variable_name="agent_scratchpad"),
-            ]
+    @functools.cached_property
+    def prompt(self) -> ChatPromptTemplate:
+        """The agent prompt; the compiled template is cached module-wide so
+        identical employee lists are built once."""
+        return _build_prompt(self.employee_list, self._severity_categories_block)
+
+    @functools.cached_property
+    def agent(self):
+        """The OpenAI tools agent."""
+        return create_openai_tools_agent(self.llm, self.tools, self.prompt)
+
+    @functools.cached_property
+    def agent_executor(self) -> AgentExecutor:
+        """The agent executor. Caps the tool loop and skips intermediate-step
+        accumulation so a confused run cannot spiral into repeated tool calls."""
+        return AgentExecutor(
+            agent=self.agent,
+            tools=self.tools,
+            max_iterations=4,
+            # "force" is the only stopping method the runnable-based agent
+            # supports; "generate" raises ValueError when the cap triggers
+            early_stopping_method="force",
+            return_intermediate_steps=False,
+            handle_parsing_errors=True,
         )
 
-        # Create the agent using LangChain's create_openai_tools_agent
-        self.agent = create_openai_tools_agent(self.llm, self.tools, self.prompt)
-
-        # Create the agent executor
-        self.agent_executor = AgentExecutor(agent=self.agent, tools=self.tools)
+    @functools.cached_property
+    def graph(self):
+        """The compiled LangGraph state graph."""
+        return self._create_graph()
 
-        # Build the graph
-        self.graph = self._create_graph()
-        logger.info("Coaching Feedback Generator initialized with LangGraph")
+    @functools.cached_property
+    def _semantic_cache(self) -> SemanticCache:
+        """Semantic cache so paraphrased repeats of a query skip the agent
+        round trip (no-op unless sentence-transformers is installed)."""
+        return SemanticCache()
 
     def _load_coaching_data(self) -> Dict[str, Any]:
         """
@@ -132,40 +631,132 @@ class CoachingFeedbackGenerator:
             Dictionary of coaching history records, organized by employee if available
         """
         try:
+            import pandas as pd
+
             file_extension = os.path.splitext(self.coaching_data_path)[1].lower()
 
             if file_extension == ".xlsx":
-                # Load from Excel
-                df = pd.read_excel(self.coaching_data_path, header=1)
-                # Rename columns based on the first row
-                df.columns = [
-                    "Status",
-                    "Date",
-                    "Category",
-                    "Subcategory",
-                    "Severity",
-                    "Statement_of_Problem",
-                    "Prior_Discussion",
-                    "Corrective_Action",
-                    "Uploaded_Pictures",
-                ]
-                coaching_data = df.to_dict(orient="records")
+                # Use the Parquet cache if it is newer than the Excel file
+                cache_path = self.coaching_data_path + ".parquet"
+                if os.path.exists(cache_path) and os.path.getmtime(
+                    cache_path
+                ) >= os.path.getmtime(self.coaching_data_path):
+                    df = pd.read_parquet(cache_path)
+                    coaching_data = _dedupe_records(
+                    [
+                        CoachingRecord(*row)
+                        for row in df[list(EXCEL_COLUMNS)].itertuples(
+                            index=False, name=None
+                        )
+                    ]
+                )
+                    logger.info(
+                        f"Loaded {len(coaching_data)} coaching records from Parquet cache"
+                    )
+                    return {"records": coaching_data}
+
+                # Load from Excel via openpyxl in read-only streaming mode
+                df = self._read_excel_records(self.coaching_data_path)
+
+                # Excel exports commonly repeat rows; drop them before caching
+                df = df.drop_duplicates(
+                    subset=["Date", "Category", "Severity", "Statement_of_Problem"]
+                )
+
+                # Cache to Parquet so the Excel parse is only paid once
+                try:
+                    df.to_parquet(cache_path, compression="zstd")
+                    logger.info(f"Cached coaching data to {cache_path}")
+                except Exception as cache_error:
+                    logger.warning(
+                        f"Could not write Parquet cache: {str(cache_error)}"
+                    )
+
+                coaching_data = _dedupe_records(
+                    [
+                        CoachingRecord(*row)
+                        for row in df[list(EXCEL_COLUMNS)].itertuples(
+                            index=False, name=None
+                        )
+                    ]
+                )
                 logger.info(
                     f"Loaded {len(coaching_data)} coaching records from Excel file"
                 )
                 return {"records": coaching_data}
 
+            elif file_extension == ".parquet":
+                # Load from a pre-converted Parquet file
+                df = pd.read_parquet(self.coaching_data_path, engine="pyarrow")
+                coaching_data = _dedupe_records(
+                    [_to_record(row) for row in df.to_dict(orient="records")]
+                )
+                logger.info(
+                    f"Loaded {len(coaching_data)} coaching records from Parquet file"
+                )
+                return {"records": coaching_data}
+
+            elif file_extension == ".csv":
+                # Load from a pre-converted CSV file
+                df = pd.read_csv(self.coaching_data_path)
+                coaching_data = _dedupe_records(
+                    [_to_record(row) for row in df.to_dict(orient="records")]
+                )
+                logger.info(
+                    f"Loaded {len(coaching_data)} coaching records from CSV file"
+                )
+                return {"records": coaching_data}
+
             elif file_extension == ".json":
-                # Load from JSON
-                with open(self.coaching_data_path, "r") as f:
-                    coaching_data = json.load(f)
+                # Use the Parquet cache (one row per record plus an Employee
+                # column) if it is newer than the JSON file
+                cache_path = self.coaching_data_path + ".parquet"
+                if os.path.exists(cache_path) and os.path.getmtime(
+                    cache_path
+                ) >= os.path.getmtime(self.coaching_data_path):
+                    df = pd.read_parquet(cache_path)
+                    coaching_by_employee = {
+                        employee: _dedupe_records(
+                            [_to_record(row) for row in group.to_dict(orient="records")]
+                        )
+                        for employee, group in df.groupby("Employee", sort=False)
+                    }
+                    logger.info(
+                        f"Loaded {len(df)} coaching records for "
+                        f"{len(coaching_by_employee)} employees from Parquet cache"
+                    )
+                    return coaching_by_employee
+
+                # Load from JSON; prefer orjson when installed, then pandas'
+                # ujson binding, then stdlib json as the final fallback. The
+                # faster parsers are stricter (orjson rejects the bare NaN
+                # literals stdlib json accepts), so parse failures fall
+                # through to the next parser just like a missing install —
+                # both libraries raise ValueError subclasses on bad input
+                with open(self.coaching_data_path, "rb") as f:
+                    raw = f.read()
+                try:
+                    import orjson
+
+                    coaching_data = orjson.loads(raw)
+                except (ImportError, ValueError):
+                    try:
+                        from pandas.io.json import ujson_loads
+
+                        coaching_data = ujson_loads(raw)
+                    except (ImportError, ValueError):
+                        coaching_data = json.loads(raw)
 
                 # Check if the JSON is organized by employee or just a list of records
                 if isinstance(coaching_data, list):
                     logger.info(
                         f"Loaded {len(coaching_data)} coaching records from JSON file"
                     )
-                    return {"records": coaching_data}
+                    return {
+                        "records": _dedupe_records(
+                            [_to_record(row) for row in coaching_data]
+                        )
+                    }
                 elif isinstance(coaching_data, dict):
                     # Count total records across all employees
                     total_records = sum(
@@ -174,7 +765,29 @@ class CoachingFeedbackGenerator:
                     logger.info(
                         f"Loaded {total_records} coaching records for {len(coaching_data)} employees from JSON file"
                     )
-                    return coaching_data
+                    coaching_by_employee = {
+                        employee: _dedupe_records(
+                            [_to_record(row) for row in records]
+                        )
+                        for employee, records in coaching_data.items()
+                    }
+
+                    # Cache to Parquet so later starts skip the JSON parse
+                    try:
+                        pd.DataFrame(
+                            [
+                                {"Employee": employee, **record._asdict()}
+                                for employee, records in coaching_by_employee.items()
+                                for record in records
+                            ]
+                        ).to_parquet(cache_path, compression="zstd")
+                        logger.info(f"Cached coaching data to {cache_path}")
+                    except Exception as cache_error:
+                        logger.warning(
+                            f"Could not write Parquet cache: {str(cache_error)}"
+                        )
+
+                    return coaching_by_employee
                 else:
                     logger.error("Unexpected JSON format")
                     raise ValueError(
@@ -184,13 +797,132 @@ class CoachingFeedbackGenerator:
             else:
                 logger.error(f"Unsupported file format: {file_extension}")
                 raise ValueError(
-                    f"Unsupported file format: {file_extension}. Please provide an Excel (.xlsx) or JSON (.json) file."
+                    f"Unsupported file format: {file_extension}. Please provide an Excel (.xlsx), Parquet (.parquet), CSV (.csv) or JSON (.json) file."
                 )
 
         except Exception as e:
             logger.error(f"Error loading coaching data: {str(e)}")
             raise
 
+    @staticmethod
+    def _read_excel_records(path: str) -> "pd.DataFrame":
+        """
+        Read the coaching details sheet into the standard coaching columns.
+
+        Prefers the Rust-based calamine engine when python-calamine is
+        installed; otherwise streams rows via openpyxl in read-only mode,
+        which avoids materializing the whole workbook the way a default
+        pd.read_excel call does.
+
+        Args:
+            path: Path to the .xlsx file
+
+        Returns:
+            DataFrame with the standard coaching columns
+        """
+        import pandas as pd
+
+        try:
+            import python_calamine  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            # Header row is row 2; data starts at row 3
+            df = pd.read_excel(
+                path,
+                engine="calamine",
+                header=None,
+                skiprows=2,
+                usecols=range(len(EXCEL_COLUMNS)),
+                names=EXCEL_COLUMNS,
+            )
+            return df.dropna(how="all").reset_index(drop=True)
+
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            worksheet = workbook.active
+            # Header row is row 2; data starts at row 3
+            rows = worksheet.iter_rows(
+                min_row=3, max_col=len(EXCEL_COLUMNS), values_only=True
+            )
+            df = pd.DataFrame(rows, columns=EXCEL_COLUMNS)
+        finally:
+            workbook.close()
+
+        # Drop trailing blank rows the streaming reader may include
+        return df.dropna(how="all").reset_index(drop=True)
+
+    def _build_frame_index(self) -> Dict[str, "pd.DataFrame"]:
+        """
+        Precompute a per-employee DataFrame of display-ready columns.
+
+        Keeping the filter and format inputs columnar lets both steps run as
+        vectorized pandas operations instead of per-record Python loops.
+
+        Returns:
+            Dictionary mapping employee name to a DataFrame with a lowercased
+            severity column plus stringified, placeholder-filled display columns
+        """
+
+        import pandas as pd
+
+        def display(series, placeholder: str):
+            values = series.astype(str)
+            return values.where(~values.isin(("", "nan", "None", "NaT")), placeholder)
+
+        frames = {}
+        if self._is_by_employee:
+            for employee, records in self.coaching_history.items():
+                df = pd.DataFrame(records, columns=CoachingRecord._fields)
+                frame = pd.DataFrame(
+                    {
+                        "_sev_lc": df["Severity"].astype(str).str.casefold(),
+                        "Date": display(df["Date"], "Unknown Date"),
+                        "Severity": display(df["Severity"], "Unknown Issue"),
+                        "Statement_of_Problem": display(
+                            df["Statement_of_Problem"], "No statement provided"
+                        ),
+                        "Prior_Discussion": display(
+                            df["Prior_Discussion"], "No prior discussion"
+                        ),
+                        "Corrective_Action": display(
+                            df["Corrective_Action"], "No corrective action specified"
+                        ),
+                    }
+                )
+                # Parsed dates support "N most recent" requests without
+                # re-parsing the display strings per call
+                frame["_date_ts"] = pd.to_datetime(df["Date"], errors="coerce")
+                # Pre-render each record's display body once; query time only
+                # prefixes "Record N:" and joins the filtered bodies
+                frame["_formatted"] = (
+                    "Date: " + frame["Date"] + "\n"
+                    "Issue: " + frame["Severity"] + "\n"
+                    "Improvement Discussion: " + frame["Statement_of_Problem"] + "\n"
+                    "Prior Discussion: " + frame["Prior_Discussion"] + "\n"
+                    "Corrective Action: " + frame["Corrective_Action"] + "\n"
+                )
+                frames[employee] = frame
+        return frames
+
+    def _build_category_index(self) -> Dict[str, List[str]]:
+        """
+        Precompute the sorted severity categories per employee.
+
+        Returns:
+            Dictionary mapping employee name to a sorted list of severity categories
+        """
+        category_index = {}
+        if self._is_by_employee:
+            for employee, records in self.coaching_history.items():
+                categories = {
+                    record.Severity for record in records if record.Severity
+                }
+                category_index[employee] = sorted(categories)
+        return category_index
+
     def _get_employee_list(self) -> str:
         """
         Get formatted list of employees from coaching history.
@@ -199,19 +931,29 @@ class CoachingFeedbackGenerator:
             Formatted string with numbered list of employees
         """
         try:
-            if (
-                isinstance(self.coaching_history, dict)
-                and not "records" in self.coaching_history
-            ):
+            # Reuse the cached list when the data file has not changed
+            signature = (
+                self.coaching_data_path,
+                os.path.getmtime(self.coaching_data_path),
+                os.path.getsize(self.coaching_data_path),
+            )
+            cached = _EMPLOYEE_LIST_CACHE.get(signature)
+            if cached is not None:
+                return cached
+
+            if self._is_by_employee:
                 employees = sorted(list(self.coaching_history.keys()))
                 if employees:
-                    return "\n".join(
+                    employee_list = "\n".join(
                         f"{i+1}. {name}" for i, name in enumerate(employees)
                     )
                 else:
-                    return "No employees found in the coaching history database."
+                    employee_list = "No employees found in the coaching history database."
             else:
-                return "Coaching history data is not organized by employee."
+                employee_list = "Coaching history data is not organized by employee."
+
+            _EMPLOYEE_LIST_CACHE[signature] = employee_list
+            return employee_list
         except Exception as e:
             logger.error(f"Error getting employee list: {str(e)}")
             return f"Error getting employee list: {str(e)}"
@@ -227,117 +969,192 @@ class CoachingFeedbackGenerator:
             Formatted string with all severity categories for the specified employee
         """
         try:
-            categories = set()
+            # Look up the pre-rendered listing for this employee
+            formatted = self._formatted_categories.get(employee)
+            if formatted is not None:
+                return formatted
+            return (
+                f"Employee '{employee}' not found in the coaching history database."
+            )
+        except Exception as e:
+            logger.error(f"Error listing severity categories: {str(e)}")
+            return f"Error listing severity categories: {str(e)}"
 
-            # Check if data is organized by employee
-            if (
-                isinstance(self.coaching_history, dict)
-                and employee in self.coaching_history
-            ):
-                # Extract categories from employee's records
-                employee_records = self.coaching_history[employee]
-                for record in employee_records:
-                    if "Severity" in record and record["Severity"]:
-                        categories.add(record["Severity"])
-
-                # Format the output
-                if categories:
-                    categories_list = sorted(list(categories))
-                    # Format each category on a new line with numbered list for better visibility
-                    formatted_categories = "\n".join(
-                        [
-                            f"{i+1}. **{category}**"
-                            for i, category in enumerate(categories_list)
-                        ]
-                    )
-                    return f"""
+    def _render_severity_categories_block(self) -> str:
+        """
+        Render the per-employee severity categories section of the system prompt.
+
+        Returns:
+            Formatted string listing each employee's severity categories,
+            numbered one per line as the prompt asks the agent to display them
+        """
+        if not self._categories_by_employee:
+            return "No severity categories on file."
+        return "\n\n".join(
+            "{}:\n{}".format(
+                employee,
+                "\n".join(
+                    f"{i}. {category}" for i, category in enumerate(categories, 1)
+                ),
+            )
+            for employee, categories in self._categories_by_employee.items()
+        )
+
+    def _render_category_listing(self, employee: str) -> str:
+        """
+        Render the severity-category listing returned by the list tool.
+
+        Args:
+            employee: Employee name
+
+        Returns:
+            Formatted string with all severity categories for the employee
+        """
+        categories_list = self._categories_by_employee.get(employee, [])
+        if not categories_list:
+            return f"No severity categories found for employee '{employee}' in the coaching history database."
+
+        # Format each category on a new line with numbered list for better visibility
+        formatted_categories = "\n".join(
+            [f"{i+1}. **{category}**" for i, category in enumerate(categories_list)]
+        )
+        return f"""
 ## Available Severity Categories for {employee}:
 
 {formatted_categories}
 
 Please select a severity category from the list above for this coaching feedback.
 """
-                else:
-                    return f"No severity categories found for employee '{employee}' in the coaching history database."
-            else:
-                return (
-                    f"Employee '{employee}' not found in the coaching history database."
-                )
-        except Exception as e:
-            logger.error(f"Error listing severity categories: {str(e)}")
-            return f"Error listing severity categories: {str(e)}"
 
-    def _get_employee_coaching(self, employee: str, severity: str) -> str:
+    def _get_employee_coaching(
+        self, employee: str, severity: str, limit: Optional[int] = None
+    ) -> str:
         """
         Get coaching history for a specific employee and severity category.
 
         Args:
             employee: Employee name
             severity: Severity category
+            limit: Optional cap on records, keeping only the most recent ones
 
         Returns:
             Formatted string with coaching history for the employee and severity
         """
         try:
-            logger.info(
-                f"Retrieving coaching for employee: {employee}, severity: {severity}"
+            logger.debug(
+                "Retrieving coaching for employee: %s, severity: %s",
+                employee,
+                severity,
             )
+            return self._format_coaching_cached(employee, severity, limit)
+        except Exception as e:
+            logger.error(f"Error retrieving employee coaching: {str(e)}")
+            return f"Error retrieving employee coaching: {str(e)}"
 
-            # Check if data is organized by employee
-            if (
-                isinstance(self.coaching_history, dict)
-                and employee in self.coaching_history
-            ):
-                # Find relevant records for this employee and severity
-                relevant_records = []
-                employee_records = self.coaching_history[employee]
+    def _get_employee_coaching_many(
+        self, employee: str, severities: List[str]
+    ) -> str:
+        """
+        Get coaching history for a specific employee across several severity
+        categories in one call.
 
-                for record in employee_records:
-                    record_severity = str(record.get("Severity", "")).lower()
-                    if severity.lower() in record_severity:
-                        relevant_records.append(record)
+        Answers a multi-severity question with a single tool round trip
+        instead of one invocation per severity; each section comes from the
+        memoized single-severity formatter.
 
-                logger.info(
-                    f"Found {len(relevant_records)} relevant coaching records for employee: {employee}, severity: {severity}"
-                )
+        Args:
+            employee: Employee name
+            severities: Severity categories to report on
 
-                # Format the results
-                if not relevant_records:
-                    return f"No coaching history found for employee '{employee}' with severity '{severity}'."
+        Returns:
+            Formatted string with one coaching history section per severity
+        """
+        try:
+            logger.debug(
+                "Retrieving coaching for employee: %s, severities: %s",
+                employee,
+                severities,
+            )
+            return "\n\n".join(
+                self._format_coaching_cached(employee, severity)
+                for severity in severities
+            )
+        except Exception as e:
+            logger.error(f"Error retrieving employee coaching: {str(e)}")
+            return f"Error retrieving employee coaching: {str(e)}"
 
-                formatted_records = []
+    def _format_coaching(
+        self, employee: str, severity: str, limit: Optional[int] = None
+    ) -> str:
+        """
+        Build the formatted coaching history for an employee and severity.
 
-                for i, record in enumerate(relevant_records, 1):
-                    date = record.get("Date", "Unknown Date")
-                    severity_value = record.get("Severity", "Unknown Issue")
-                    statement = record.get(
-                        "Statement_of_Problem", "No statement provided"
-                    )
-                    prior = record.get("Prior_Discussion", "No prior discussion")
-                    action = record.get(
-                        "Corrective_Action", "No corrective action specified"
-                    )
+        Pure function of its arguments and the immutable coaching data, so the
+        bounded LRU wrapper created in __init__ can memoize it safely.
+
+        Args:
+            employee: Employee name
+            severity: Severity category
+            limit: Optional cap on records; when set, the most recent records
+                   are kept and listed newest first
 
-                    entry = f"Record {i}:\n"
-                    entry += f"Date: {date}\n"
-                    entry += f"Issue: {severity_value}\n"
-                    entry += f"Improvement Discussion: {statement}\n"
-                    entry += f"Prior Discussion: {prior}\n"
-                    entry += f"Corrective Action: {action}\n"
+        Returns:
+            Formatted string with coaching history for the employee and severity
+        """
+        # Casefold the query once; all comparisons below reuse it
+        severity_lc_query = severity.casefold()
+
+        # Check if data is organized by employee
+        if self._is_by_employee and employee in self.coaching_history:
+            # Run the substring match against the tiny per-employee category
+            # list; the row mask is then an exact membership test, so the
+            # per-row work is O(|categories|) hashing instead of a scan of
+            # every severity string
+            matching_categories = [
+                category
+                for category in self._categories_lc_by_employee.get(employee, [])
+                if severity_lc_query in category
+            ]
+            if not matching_categories:
+                return f"No coaching history found for employee '{employee}' with severity '{severity}'."
 
-                    formatted_records.append(entry)
+            import numpy as np
 
-                return (
-                    f"Coaching history for {employee} - {severity}:\n\n"
-                    + "\n\n".join(formatted_records)
-                )
-            else:
-                return (
-                    f"Employee '{employee}' not found in the coaching history database."
-                )
-        except Exception as e:
-            logger.error(f"Error retrieving employee coaching: {str(e)}")
-            return f"Error retrieving employee coaching: {str(e)}"
+            frame = self._frames_by_employee[employee]
+            mask = np.isin(self._sev_arr_by_employee[employee], matching_categories)
+            relevant = frame[mask]
+
+            logger.debug(
+                "Found %d relevant coaching records for employee: %s, severity: %s",
+                len(relevant),
+                employee,
+                severity,
+            )
+
+            # Format the results
+            if relevant.empty:
+                return f"No coaching history found for employee '{employee}' with severity '{severity}'."
+
+            # Keep only the most recent records when a limit is requested;
+            # nlargest is O(n log limit) vs a full sort
+            if limit is not None and limit < len(relevant):
+                relevant = relevant.nlargest(limit, "_date_ts")
+
+            # Join the record bodies pre-rendered at load; only the
+            # "Record N:" prefix is built per call
+            body = "\n\n".join(
+                f"Record {i}:\n{formatted}"
+                for i, formatted in enumerate(relevant["_formatted"], 1)
+            )
+            return f"Coaching history for {employee} - {severity}:\n\n" + body
+        else:
+            return (
+                f"Employee '{employee}' not found in the coaching history database."
+            )
+
+    def _coaching_cache_info(self):
+        """Expose hit/miss statistics for the formatted-history cache."""
+        return self._format_coaching_cached.cache_info()
 
     def _create_graph(self) -> StateGraph:
         """
@@ -349,52 +1166,122 @@ Please select a severity category from the list above for this coaching feedback
         # Create the graph builder with the state schema
         graph_builder = StateGraph(CoachingFeedbackState)
 
-        # Define the agent node
-        def agent_node(state: CoachingFeedbackState) -> Dict[str, Any]:
-            """Process messages using the agent."""
+        def agent_input(state: CoachingFeedbackState) -> Dict[str, Any]:
+            """Build the executor input from the graph state."""
             # Get the last message from the user
             last_message = state["messages"][-1]
 
-            # Extract conversation history
-            history = []
-            if len(state["messages"]) > 1:
-                for msg in state["messages"][:-1]:
-                    if isinstance(msg, HumanMessage):
-                        history.append(("human", msg.content))
-                    elif isinstance(msg, AIMessage):
-                        history.append(("ai", msg.content))
+            # Pass the checkpointed messages straight through: the prompt's
+            # MessagesPlaceholder accepts BaseMessage objects, so there is no
+            # need to re-walk the history into tuples on every turn. Keep the
+            # last 10 messages to bound prompt tokens on long sessions.
+            history = state["messages"][:-1][-10:]
 
+            return {"input": last_message.content, "chat_history": history}
+
+        def agent_error(e: Exception) -> Dict[str, Any]:
+            """Log an agent failure and return the fallback response."""
+            logger.error(f"Error in agent_node: {str(e)}")
+            return {"messages": [AIMessage(content=_ERROR_RESPONSE)]}
+
+        # Define the agent node
+        def agent_node(state: CoachingFeedbackState) -> Dict[str, Any]:
+            """Process messages using the agent."""
             try:
-                # Call the agent with history
-                result = self.agent_executor.invoke(
-                    {"input": last_message.content, "chat_history": history}
-                )
+                result = self.agent_executor.invoke(agent_input(state))
+                return {"messages": [AIMessage(content=result["output"])]}
+            except Exception as e:
+                return agent_error(e)
 
-                # Return the response as an AI message
+        async def agent_node_async(state: CoachingFeedbackState) -> Dict[str, Any]:
+            """Async variant: awaits the executor instead of blocking a thread."""
+            try:
+                result = await self.agent_executor.ainvoke(agent_input(state))
                 return {"messages": [AIMessage(content=result["output"])]}
             except Exception as e:
-                # Log the error
-                logger.error(f"Error in agent_node: {str(e)}")
-
-                # Return a generic error message
-                return {
-                    "messages": [
-                        AIMessage(
-                            content="I'm sorry, I encountered an error while processing your request. Please try again with more specific instructions."
-                        )
-                    ]
-                }
+                return agent_error(e)
+
+        def direct_messages(state: CoachingFeedbackState) -> List[BaseMessage]:
+            """Build the plain-LLM input: system prompt plus the session."""
+            system = SystemMessage(
+                content=_render_system_prompt(
+                    self.employee_list, self._severity_categories_block
+                )
+            )
+            return [system] + list(state["messages"])
+
+        def direct_node(state: CoachingFeedbackState) -> Dict[str, Any]:
+            """Answer without the tool loop for queries that need no lookups."""
+            try:
+                response = self.llm.invoke(direct_messages(state))
+                return {"messages": [AIMessage(content=response.content)]}
+            except Exception as e:
+                return agent_error(e)
 
-        # Add the node to the graph
-        graph_builder.add_node("agent", agent_node)
+        async def direct_node_async(state: CoachingFeedbackState) -> Dict[str, Any]:
+            """Async variant of direct_node."""
+            try:
+                response = await self.llm.ainvoke(direct_messages(state))
+                return {"messages": [AIMessage(content=response.content)]}
+            except Exception as e:
+                return agent_error(e)
+
+        def route_query(state: CoachingFeedbackState) -> str:
+            """
+            Send queries that cannot use the tools straight to the LLM.
+
+            Only session-initial turns may skip the agent: once a
+            conversation is underway, short replies like "2" or "yes"
+            advance the coaching flow and must reach the tool-calling
+            agent even though they name no employee themselves.
+            """
+            if len(state["messages"]) > 1:
+                return "agent"
+            if state.get("severity_category"):
+                return "agent"
+            query = state["messages"][-1].content.casefold()
+            employees = getattr(self, "_frames_by_employee", {})
+            if any(name.casefold() in query for name in employees):
+                return "agent"
+            return "direct"
+
+        # Register both implementations so graph.invoke stays synchronous
+        # while ainvoke/abatch await the executor natively
+        graph_builder.add_node(
+            "agent", RunnableLambda(agent_node, afunc=agent_node_async)
+        )
+        graph_builder.add_node(
+            "direct_llm", RunnableLambda(direct_node, afunc=direct_node_async)
+        )
 
         # Add edges
-        graph_builder.add_edge(START, "agent")
+        graph_builder.add_conditional_edges(
+            START, route_query, {"agent": "agent", "direct": "direct_llm"}
+        )
         graph_builder.add_edge("agent", END)
+        graph_builder.add_edge("direct_llm", END)
 
         # Compile the graph with the memory saver
         return graph_builder.compile(checkpointer=self.memory)
 
+    @staticmethod
+    def _extract_response(result: Dict[str, Any]) -> str:
+        """
+        Extract the AI response content from a graph invocation result.
+
+        Args:
+            result: State returned by the graph
+
+        Returns:
+            The content of the final AI message, or a fallback message
+        """
+        if result and "messages" in result and len(result["messages"]) > 0:
+            # Get the last message (the response)
+            last_message = result["messages"][-1]
+            if isinstance(last_message, AIMessage):
+                return last_message.content
+        return _NO_RESPONSE
+
     def generate_feedback(self, query: str, session_id: str = None) -> str:
         """
         Generate coaching feedback based on the query using LangGraph.
@@ -407,14 +1294,14 @@ Please select a severity category from the list above for this coaching feedback
             Structured coaching feedback
         """
         try:
-            logger.info(f"Generating feedback for query: {query}")
+            logger.info("Generating feedback for query: %s", query)
 
             # Generate a unique session ID if not provided
             if not session_id:
                 session_id = str(uuid.uuid4())
-                logger.info(f"Generated new session ID: {session_id}")
+                logger.info("Generated new session ID: %s", session_id)
             else:
-                logger.info(f"Using existing session ID: {session_id}")
+                logger.info("Using existing session ID: %s", session_id)
 
             # Create a human message
             human_message = HumanMessage(content=query)
@@ -422,31 +1309,364 @@ Please select a severity category from the list above for this coaching feedback
             # Set up the config for this session
             config = {"configurable": {"thread_id": session_id}}
 
+            # Only consult the semantic cache on session-initial turns.
+            # Mid-conversation replies ("yes", "2") embed near-identically
+            # wherever the dialogue stands, so a hit there would replay a
+            # response from a different point in the flow.
+            is_initial_turn = self.memory.get_tuple(config) is None
+            cached = query_embedding = None
+            if is_initial_turn:
+                cached, query_embedding = self._semantic_cache.get(query)
+            if cached is not None:
+                # Checkpoint the replayed exchange so the thread history
+                # matches what the user saw and later turns stay coherent
+                self.graph.update_state(
+                    config,
+                    {"messages": [human_message, AIMessage(content=cached)]},
+                    as_node="agent",
+                )
+                return cached
+
             # Prepare the initial state
             initial_state = {
                 "messages": [human_message],
                 "employee_name": None,
-                "severity_category": None,
+                "severity_category": match_severity_category(query),
             }
 
             # Invoke the graph with the message
             result = self.graph.invoke(initial_state, config=config)
 
-            # Extract and return the response content
-            if result and "messages" in result and len(result["messages"]) > 0:
-                # Get the last message (the response)
-                last_message = result["messages"][-1]
-                if isinstance(last_message, AIMessage):
-                    return last_message.content
-
             logger.info("Message processed successfully")
-            return "Sorry, I couldn't generate a response."
+            response = self._extract_response(result)
+            # Never cache the canned failure texts: a transient LLM outage
+            # would otherwise be replayed to every similar opening query
+            if is_initial_turn and response not in (_ERROR_RESPONSE, _NO_RESPONSE):
+                self._semantic_cache.put(query_embedding, response)
+            return response
+
+        except Exception as e:
+            error_msg = f"Error generating feedback: {str(e)}"
+            logger.error(error_msg)
+            return f"An error occurred while generating feedback: {str(e)}"
+
+
+    async def generate_feedback_async(self, query: str, session_id: str = None) -> str:
+        """
+        Async variant of generate_feedback.
+
+        Awaiting the graph lets a FastAPI worker overlap many concurrent LLM
+        calls instead of blocking the event loop on each one.
+
+        Args:
+            query: The coaching query/reason
+            session_id: Optional session ID for maintaining conversation history
+
+        Returns:
+            Structured coaching feedback
+        """
+        try:
+            logger.info("Generating feedback for query: %s", query)
+
+            if not session_id:
+                session_id = str(uuid.uuid4())
+                logger.info("Generated new session ID: %s", session_id)
+
+            initial_state = {
+                "messages": [HumanMessage(content=query)],
+                "employee_name": None,
+                "severity_category": match_severity_category(query),
+            }
+            config = {"configurable": {"thread_id": session_id}}
+
+            result = await self.graph.ainvoke(initial_state, config=config)
+            return self._extract_response(result)
 
         except Exception as e:
             error_msg = f"Error generating feedback: {str(e)}"
             logger.error(error_msg)
             return f"An error occurred while generating feedback: {str(e)}"
 
+    # Conventional a-prefixed name for the async entry point
+    agenerate_feedback = generate_feedback_async
+
+    async def stream_feedback(self, query: str, session_id: str = None):
+        """
+        Stream coaching feedback token by token as the LLM produces it.
+
+        Yields the completion incrementally so a caller (e.g. a FastAPI
+        StreamingResponse) can show first tokens immediately instead of
+        waiting for the full response.
+
+        Args:
+            query: The coaching query/reason
+            session_id: Optional session ID for maintaining conversation history
+
+        Yields:
+            Response content chunks in generation order
+        """
+        if not session_id:
+            session_id = str(uuid.uuid4())
+            logger.info("Generated new session ID: %s", session_id)
+
+        initial_state = {
+            "messages": [HumanMessage(content=query)],
+            "employee_name": None,
+            "severity_category": match_severity_category(query),
+        }
+        config = {"configurable": {"thread_id": session_id}}
+
+        streamed = False
+        try:
+            async for event in self.graph.astream_events(
+                initial_state, config=config, version="v2"
+            ):
+                if event["event"] == "on_chat_model_stream":
+                    chunk = event["data"]["chunk"]
+                    # Tool-call deltas carry arguments, not answer text;
+                    # only forward genuine content chunks
+                    if getattr(chunk, "tool_call_chunks", None):
+                        continue
+                    if chunk.content:
+                        streamed = True
+                        yield chunk.content
+        except Exception as e:
+            error_msg = f"Error streaming feedback: {str(e)}"
+            logger.error(error_msg)
+            yield f"An error occurred while generating feedback: {str(e)}"
+            return
+
+        if not streamed:
+            # The node-level handlers swallow LLM failures and return the
+            # canned apology as an ordinary message, so no stream events
+            # fire; surface the run's final message instead of closing an
+            # empty response body
+            state = await self.graph.aget_state(config)
+            yield self._extract_response(state.values)
+
+    # Conventional a-prefixed name for the streaming entry point
+    astream_feedback = stream_feedback
+
+    async def generate_feedback_gather(
+        self,
+        queries: List[str],
+        session_ids: Optional[List[str]] = None,
+        max_concurrency: int = 8,
+    ) -> List[str]:
+        """
+        Fan out several feedback queries concurrently with asyncio.gather.
+
+        Concurrency is capped with a semaphore so a large fan-out does not
+        trip OpenAI rate limits.
+
+        Args:
+            queries: List of coaching queries
+            session_ids: Optional list of session IDs, one per query
+            max_concurrency: Maximum number of queries in flight at once
+
+        Returns:
+            List of structured coaching feedback strings, one per query
+        """
+        if session_ids is None:
+            session_ids = [None] * len(queries)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(query: str, session_id: Optional[str]) -> str:
+            async with semaphore:
+                return await self.generate_feedback_async(query, session_id)
+
+        return await asyncio.gather(
+            *[
+                bounded(query, session_id)
+                for query, session_id in zip(queries, session_ids)
+            ]
+        )
+
+    def generate_feedback_batch(
+        self, queries: List[str], session_ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Generate coaching feedback for multiple queries in a single batched call.
+
+        Batching lets the underlying OpenAI client issue the requests
+        concurrently instead of paying one full round trip per query.
+
+        Args:
+            queries: List of coaching queries
+            session_ids: Optional list of session IDs, one per query. If not
+                         provided, a new session ID is generated for each query.
+
+        Returns:
+            List of structured coaching feedback strings, one per query
+        """
+        try:
+            if session_ids is None:
+                session_ids = [str(uuid.uuid4()) for _ in queries]
+
+            logger.info("Generating feedback for batch of %d queries", len(queries))
+
+            # Prepare one initial state and config per query
+            initial_states = [
+                {
+                    "messages": [HumanMessage(content=query)],
+                    "employee_name": None,
+                    "severity_category": match_severity_category(query),
+                }
+                for query in queries
+            ]
+            configs = [
+                {"configurable": {"thread_id": session_id}, "max_concurrency": 16}
+                for session_id in session_ids
+            ]
+
+            # Invoke the graph once for the whole batch
+            results = self.graph.batch(initial_states, config=configs)
+
+            # Extract the response content for each query
+            return [self._extract_response(result) for result in results]
+
+        except Exception as e:
+            error_msg = f"Error generating batch feedback: {str(e)}"
+            logger.error(error_msg)
+            return [
+                f"An error occurred while generating feedback: {str(e)}"
+                for _ in queries
+            ]
+
+
+class CoachingFeedbackScheduler:
+    """
+    Async scheduler that batches queued coaching queries into size bins.
+
+    Queries of very different lengths dispatched together cause head-of-line
+    blocking: one long query holds up the whole batch. The scheduler collects
+    queries for a short interval, sorts them by length, partitions them into
+    bins, and dispatches one batched graph call per bin.
+    """
+
+    def __init__(
+        self,
+        generator: CoachingFeedbackGenerator,
+        flush_interval: float = 0.05,
+        bin_edges: tuple = (2048, 8192),
+        batch_size: int = 8,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            generator: The CoachingFeedbackGenerator to dispatch batches to
+            flush_interval: Seconds to wait between queue drains
+            bin_edges: Query-length boundaries separating the size bins
+            batch_size: Maximum number of queries dispatched per batch
+        """
+        self.generator = generator
+        self.flush_interval = flush_interval
+        self.bin_edges = bin_edges
+        self.batch_size = batch_size
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._drain_task: Optional[asyncio.Task] = None
+
+    async def submit(self, query: str, session_id: str = None) -> str:
+        """
+        Queue a coaching query and wait for its batched result.
+
+        Args:
+            query: The coaching query
+            session_id: Optional session ID for maintaining conversation history
+
+        Returns:
+            Structured coaching feedback
+        """
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((len(query), query, session_id, future))
+        return await future
+
+    async def _drain(self):
+        """Drain the queue periodically and dispatch one batch per size bin."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+
+            pending = []
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+
+            if not pending:
+                continue
+
+            # Sort by query length and partition into size bins so short
+            # queries are not stuck behind long ones
+            pending.sort(key=lambda item: item[0])
+            bins = [[] for _ in range(len(self.bin_edges) + 1)]
+            for item in pending:
+                bins[bisect.bisect(self.bin_edges, item[0])].append(item)
+
+            for size_bin in bins:
+                for start in range(0, len(size_bin), self.batch_size):
+                    await self._dispatch(size_bin[start : start + self.batch_size])
+
+    async def _dispatch(self, items: list):
+        """Run one batched graph call and resolve the waiting futures."""
+        initial_states = []
+        configs = []
+        for _, query, session_id, _ in items:
+            initial_states.append(
+                {
+                    "messages": [HumanMessage(content=query)],
+                    "employee_name": None,
+                    "severity_category": match_severity_category(query),
+                }
+            )
+            configs.append(
+                {"configurable": {"thread_id": session_id or str(uuid.uuid4())}}
+            )
+
+        try:
+            results = await self.generator.graph.abatch(initial_states, config=configs)
+            for (_, _, _, future), result in zip(items, results):
+                if not future.done():
+                    future.set_result(self.generator._extract_response(result))
+        except Exception as e:
+            logger.error(f"Error dispatching feedback batch: {str(e)}")
+            for _, _, _, future in items:
+                if not future.done():
+                    future.set_result(
+                        f"An error occurred while generating feedback: {str(e)}"
+                    )
+
+
+@functools.lru_cache(maxsize=None)
+def _build_generator(api_key: str, coaching_data_path: str) -> CoachingFeedbackGenerator:
+    return CoachingFeedbackGenerator(api_key, coaching_data_path)
+
+
+def get_coaching_feedback_generator(
+    api_key: str = None, coaching_data_path: str = None
+) -> CoachingFeedbackGenerator:
+    """
+    Return a shared CoachingFeedbackGenerator for the given key and data path.
+
+    Constructing the generator parses the whole coaching data file and wires
+    up the agent graph, so callers sharing the same (api_key, path) pair get
+    one cached instance instead of repeating that work.
+
+    Args:
+        api_key: OpenAI API key. If not provided, will try to get from environment.
+        coaching_data_path: Path to the coaching data file. If not provided,
+                            resolved via resolve_coaching_data_path().
+
+    Returns:
+        Shared CoachingFeedbackGenerator instance
+    """
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+    coaching_data_path = os.path.realpath(
+        coaching_data_path or resolve_coaching_data_path()
+    )
+    return _build_generator(api_key, coaching_data_path)
+
 
 def main():
     """
@@ -460,17 +1680,8 @@ def main():
     if not api_key:
         raise ValueError("Please set OPENAI_API_KEY environment variable")
 
-    # Path to coaching data - prioritize the combined JSON file
-    coaching_data_path = os.path.join(
-        os.getcwd(), "json_output", "combined_coaching_history.json"
-    )
-    if not os.path.exists(coaching_data_path):
-        coaching_data_path = os.path.join(os.getcwd(), "coaching_history.json")
-        if not os.path.exists(coaching_data_path):
-            coaching_data_path = os.path.join(os.getcwd(), "Coaching Details.xlsx")
-
-    # Initialize the agent
-    generator = CoachingFeedbackGenerator(api_key, coaching_data_path)
+    # Initialize the agent (shared instance keyed by api_key and data path)
+    generator = get_coaching_feedback_generator(api_key)
 
     print("Coaching Feedback Generator started! Type 'q' or 'quit' to exit.")
     session_id = str(uuid.uuid4())
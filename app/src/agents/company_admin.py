@@ -29,10 +29,6 @@ from ..models.question_models import CompanyQuestions, Question
 from ..managers.company_questions_factory import get_company_questions_manager
 from ..tools.company_admin_tools import CompanyAdminTools
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
@@ -182,9 +178,11 @@ class CompanyAdminAgent:
 
         # Create the agent executor with proper configuration
         self.agent_executor = AgentExecutor(
-            agent=self.agent, 
+            agent=self.agent,
             tools=self.tools,
-            verbose=True,
+            # Verbose serializes prompts and intermediate steps to stdout on
+            # every call; keep it off unless explicitly enabled for debugging
+            verbose=os.getenv("LC_VERBOSE") == "1",
             handle_parsing_errors=True,
             max_iterations=5,
             early_stopping_method="generate"
@@ -12,10 +12,6 @@ from langgraph.checkpoint.memory import MemorySaver
 
 from ..prompts.content_generator import CONTENT_PROMPT
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
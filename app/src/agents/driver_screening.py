@@ -57,12 +57,12 @@ listeventtool = None
 # listeventtool = ListGoogleCalendarEvents.from_api_resource(calendar_service)
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
+# Bare greetings that should trigger the personalized opening message;
+# frozenset membership is one hash lookup instead of a list scan
+_GREETINGS = frozenset({"hi", "hello", "hey", "greetings"})
+
 
 class DriverScreeningState(TypedDict):
     """State schema for the driver screening graph."""
@@ -157,7 +157,7 @@ class DriverScreeningAgent:
                 
                 # Log the structure of the first question to debug
                 if questions_list:
-                    logger.info(f"First question structure: {questions_list[0]}")
+                    logger.debug("First question structure: %r", questions_list[0])
                 
                 for i, question in enumerate(questions_list, 1):
                     # Check for different possible field names for question text
@@ -415,7 +415,7 @@ class DriverScreeningAgent:
                 )
 
                 # Log the result
-                logger.info(f"Status update result: {result}")
+                logger.debug("Status update result: %r", result)
             else:
                 logger.info(
                     f"Not updating applicant status for {applicant_name} as current status is {current_status}"
@@ -455,11 +455,7 @@ class DriverScreeningAgent:
             if is_new_session and applicant_details and not user_input.strip():
                 # For the first message, we'll use a special trigger to ensure the agent
                 # starts with the personalized greeting
-                if not user_input.strip() or user_input.lower().strip() in [
-                    "hi",
-                    "hello",
-                    "hey",
-                ]:
+                if not user_input.strip() or user_input.strip().lower() in _GREETINGS:
                     # Replace with a special trigger that the agent will recognize
                     user_input = "START_GREETING"
                     logger.info("Using special greeting trigger for first message")
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from ..agents.performance_analyzer import PerformanceAnalyzerAgent
-from ..agents.coaching_history_analyzer import CoachingFeedbackGenerator
+from ..agents.coaching_history_analyzer import (
+    get_coaching_feedback_generator,
+    resolve_coaching_data_path,
+)
 from ..core.config import get_settings
 from ..agents import ContentGeneratorAgent, DriverScreeningAgent, CompanyAdminAgent
 from typing import Optional, List, Dict
@@ -21,16 +25,10 @@ performance_analyzer = PerformanceAnalyzerAgent(settings.OPENAI_API_KEY)
 
 # Initialize coaching feedback generator
 # Prioritize the combined JSON file
-coaching_data_path = os.path.join(
-    os.getcwd(), "json_output", "combined_coaching_history.json"
-)
-if not os.path.exists(coaching_data_path):
-    coaching_data_path = os.path.join(os.getcwd(), "coaching_history.json")
-    if not os.path.exists(coaching_data_path):
-        coaching_data_path = os.path.join(os.getcwd(), "Coaching Details.xlsx")
+coaching_data_path = resolve_coaching_data_path()
 
 logger.info(f"Loading coaching data from: {coaching_data_path}")
-coaching_feedback_generator = CoachingFeedbackGenerator(
+coaching_feedback_generator = get_coaching_feedback_generator(
     settings.OPENAI_API_KEY, coaching_data_path
 )
 
@@ -209,7 +207,7 @@ async def driver_screening(request: DriverScreeningRequest):
 
                 if applicant_details_obj:
                     applicant_details = applicant_details_obj.model_dump()
-                    logger.info(f"Retrieved applicant details: {applicant_details}")
+                    logger.debug("Retrieved applicant details: %r", applicant_details)
 
             result = driver_screening_agent.process_message(
                 message, session_id, dsp_code, station_code, applicant_id
@@ -322,3 +320,21 @@ async def generate_coaching_feedback(request: CoachingFeedbackRequest):
     except Exception as e:
         logger.error(f"Error generating coaching feedback: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post(
+    "/coaching-feedback/stream",
+    summary="Stream structured coaching feedback",
+    description="Streams coaching feedback tokens as they are generated, so clients can render the response incrementally",
+)
+async def stream_coaching_feedback(request: CoachingFeedbackRequest):
+    # Validate request
+    if not request.message or request.message.strip() == "":
+        raise HTTPException(status_code=400, detail="Coaching query is required")
+
+    return StreamingResponse(
+        coaching_feedback_generator.astream_feedback(
+            query=request.message, session_id=request.session_id
+        ),
+        media_type="text/plain",
+    )
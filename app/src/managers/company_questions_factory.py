@@ -4,10 +4,6 @@ from ..core.config import get_settings
 from .company_questions_manager import CompanyQuestionsManager
 from .firebase_company_questions_manager import FirebaseCompanyQuestionsManager
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
@@ -5,10 +5,6 @@ from pymongo import IndexModel, ASCENDING
 from pymongo.errors import PyMongoError
 from ..core.database import get_db
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
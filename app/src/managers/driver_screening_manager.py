@@ -6,10 +6,6 @@ from pymongo.errors import PyMongoError
 from datetime import datetime
 from ..core.database import get_db
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
@@ -4,10 +4,6 @@ import logging
 from firebase_admin import firestore
 from ..core.firebase_config import get_firestore_db
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
@@ -11,10 +11,6 @@ from ..models.question_models import (
 )
 from ..managers.company_questions_factory import get_company_questions_manager
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
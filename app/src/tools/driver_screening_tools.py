@@ -6,13 +6,21 @@ from .dsp_api_client import DSPApiClient, ApplicantDetails
 import datetime
 import re
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response to JSON, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
 class GetDateBasedTimeSlotsInput(BaseModel):
     """Input model for get_date_based_time_slots tool"""
     time_slots: List[str] = Field(..., description="List of time slots in format 'Day Time Range' (e.g., 'Monday 9-5')")
@@ -57,11 +65,11 @@ class DriverScreeningTools:
             )
 
             if applicant_details:
-                return json.dumps(
+                return _dumps(
                     {"success": True, "data": applicant_details.model_dump()}
                 )
             else:
-                return json.dumps(
+                return _dumps(
                     {
                         "success": False,
                         "message": f"Failed to retrieve applicant details for DSP code: {dsp_code}",
@@ -70,7 +78,7 @@ class DriverScreeningTools:
 
         except Exception as e:
             logger.error(f"Error retrieving applicant details: {e}")
-            return json.dumps({"success": False, "message": f"Error: {str(e)}"})
+            return _dumps({"success": False, "message": f"Error: {str(e)}"})
 
     def _update_applicant_status(self, input_data: UpdateApplicantStatusInput) -> str:
         """
@@ -104,14 +112,14 @@ class DriverScreeningTools:
             )
 
             if status_updated:
-                return json.dumps(
+                return _dumps(
                     {
                         "success": True,
                         "message": f"Successfully updated applicant status to {new_status}",
                     }
                 )
             else:
-                return json.dumps(
+                return _dumps(
                     {
                         "success": False,
                         "message": f"Failed to update applicant status to {new_status}",
@@ -120,7 +128,7 @@ class DriverScreeningTools:
 
         except Exception as e:
             logger.error(f"Error updating applicant status: {e}")
-            return json.dumps({"success": False, "message": f"Error: {str(e)}"})
+            return _dumps({"success": False, "message": f"Error: {str(e)}"})
 
     def update_applicant_status(self, input_str: str) -> str:
         """
@@ -151,7 +159,7 @@ class DriverScreeningTools:
             
         except Exception as e:
             logger.error(f"Error in string version of update_applicant_status: {e}")
-            return json.dumps({"success": False, "message": f"Error: {str(e)}"})
+            return _dumps({"success": False, "message": f"Error: {str(e)}"})
 
     def update_applicant_status_multi(
         self, 
@@ -191,7 +199,7 @@ class DriverScreeningTools:
             
         except Exception as e:
             logger.error(f"Error in multi-arg version of update_applicant_status: {e}")
-            return json.dumps({"success": False, "message": f"Error: {str(e)}"})
+            return _dumps({"success": False, "message": f"Error: {str(e)}"})
 
     def _get_date_based_time_slots(self, input_data: GetDateBasedTimeSlotsInput) -> str:
         """
@@ -205,7 +213,7 @@ class DriverScreeningTools:
             JSON string with date-based time slots
         """
         try:
-            logger.info(f"Generating date-based time slots for: {input_data.time_slots}")
+            logger.debug("Generating date-based time slots for: %r", input_data.time_slots)
 
             # Dictionary to map day names to weekday numbers (0 = Monday in datetime)
             day_to_weekday = {
@@ -248,14 +256,14 @@ class DriverScreeningTools:
                     formatted_date = next_date.strftime("%A, %B %d, %Y")  # e.g., "Monday, April 21, 2025"
                     date_based_slots.append(f"{formatted_date} {time_range}")
 
-            return json.dumps({
+            return _dumps({
                 "success": True,
                 "date_based_slots": date_based_slots
             })
 
         except Exception as e:
             logger.error(f"Error generating date-based time slots: {e}")
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "message": f"Error generating date-based time slots: {str(e)}"
             })
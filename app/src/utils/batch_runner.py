@@ -0,0 +1,192 @@
+"""
+Offline coaching feedback backfills via the OpenAI Batch API.
+
+Interactive requests go through the agent graph; for non-interactive jobs
+(e.g. generating feedback for every driver in a fleet nightly) the Batch API
+runs the same model at half the cost with a 24h completion window. Batch
+requests are single-shot chat completions, so this path skips the coaching
+tools and is only suitable for summarization-style feedback.
+
+Usage:
+    python -m app.src.utils.batch_runner queries.txt --wait --output results.json
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "gpt-4o-mini"
+DEFAULT_TEMPERATURE = 0.2
+
+# Single-shot prompt for the tool-less batch path
+BATCH_SYSTEM_PROMPT = (
+    "You are a professional DSP (Delivery Service Provider) coaching "
+    "assistant. Generate structured, constructive coaching feedback for the "
+    "driver incident described in the user's message."
+)
+
+
+def build_batch_lines(
+    queries: List[str],
+    system_prompt: str = BATCH_SYSTEM_PROMPT,
+    model: str = DEFAULT_MODEL,
+    temperature: float = DEFAULT_TEMPERATURE,
+) -> List[Dict]:
+    """
+    Build one Batch API request object per query.
+
+    Args:
+        queries: Coaching queries, one per request
+        system_prompt: System prompt shared by all requests
+        model: Chat model to run
+        temperature: Sampling temperature
+
+    Returns:
+        List of JSON-serializable request dicts with stable custom_ids
+    """
+    return [
+        {
+            "custom_id": f"coaching-{i}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model,
+                "temperature": temperature,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": query},
+                ],
+            },
+        }
+        for i, query in enumerate(queries)
+    ]
+
+
+def submit_batch(
+    queries: List[str],
+    system_prompt: str = BATCH_SYSTEM_PROMPT,
+    model: str = DEFAULT_MODEL,
+    api_key: Optional[str] = None,
+) -> str:
+    """
+    Upload the requests as a JSONL batch file and create the batch job.
+
+    Args:
+        queries: Coaching queries to process
+        system_prompt: System prompt shared by all requests
+        model: Chat model to run
+        api_key: OpenAI API key. If not provided, will try to get from environment.
+
+    Returns:
+        The created batch ID
+    """
+    from openai import OpenAI
+
+    client = OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
+
+    lines = build_batch_lines(queries, system_prompt=system_prompt, model=model)
+    payload = "\n".join(json.dumps(line) for line in lines).encode()
+    batch_file = client.files.create(file=io.BytesIO(payload), purpose="batch")
+
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info(f"Submitted batch {batch.id} with {len(lines)} requests")
+    return batch.id
+
+
+def collect_batch(
+    batch_id: str,
+    poll_interval: float = 30.0,
+    api_key: Optional[str] = None,
+) -> Dict[str, str]:
+    """
+    Wait for a batch to finish and return its responses.
+
+    Args:
+        batch_id: Batch ID returned by submit_batch
+        poll_interval: Seconds between status polls
+        api_key: OpenAI API key. If not provided, will try to get from environment.
+
+    Returns:
+        Mapping of custom_id to the generated feedback text
+
+    Raises:
+        RuntimeError: If the batch ends in a non-completed state
+    """
+    from openai import OpenAI
+
+    client = OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
+
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status == "completed":
+            break
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"Batch {batch_id} ended with status {batch.status}")
+        logger.info(f"Batch {batch_id} status: {batch.status}")
+        time.sleep(poll_interval)
+
+    results = {}
+    content = client.files.content(batch.output_file_id)
+    for line in content.text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        body = record.get("response", {}).get("body", {})
+        choices = body.get("choices") or []
+        if choices:
+            results[record["custom_id"]] = choices[0]["message"]["content"]
+    logger.info(f"Collected {len(results)} responses from batch {batch_id}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run coaching feedback queries through the OpenAI Batch API"
+    )
+    parser.add_argument("queries_file", help="Text file with one query per line")
+    parser.add_argument(
+        "--model", default=DEFAULT_MODEL, help="Chat model to run the batch with"
+    )
+    parser.add_argument(
+        "--wait",
+        action="store_true",
+        help="Poll until the batch completes and print/save the responses",
+    )
+    parser.add_argument(
+        "--output", help="Optional path to write the collected responses as JSON"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    with open(args.queries_file) as f:
+        queries = [line.strip() for line in f if line.strip()]
+    if not queries:
+        raise ValueError(f"No queries found in {args.queries_file}")
+
+    batch_id = submit_batch(queries, model=args.model)
+    print(f"Batch ID: {batch_id}")
+
+    if args.wait:
+        results = collect_batch(batch_id)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+            print(f"Wrote {len(results)} responses to {args.output}")
+        else:
+            for custom_id, response in results.items():
+                print(f"\n=== {custom_id} ===\n{response}")
+
+
+if __name__ == "__main__":
+    main()
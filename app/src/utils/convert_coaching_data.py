@@ -0,0 +1,78 @@
+"""
+One-time converter for the coaching details Excel sheet.
+
+Reading the .xlsx is by far the slowest part of loading the coaching data.
+This script converts it once to Parquet (or CSV) so the loaders can use the
+much faster columnar/CSV readers on every subsequent start.
+
+Usage:
+    python -m app.src.utils.convert_coaching_data "Coaching Details.xlsx"
+"""
+
+import argparse
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def convert_coaching_data(
+    input_path: str, output_path: str = None, output_format: str = "parquet"
+) -> str:
+    """
+    Convert a coaching details .xlsx file to Parquet or CSV.
+
+    Args:
+        input_path: Path to the source .xlsx file
+        output_path: Optional output path. Defaults to the input path with the
+                     target format's extension.
+        output_format: Either "parquet" or "csv"
+
+    Returns:
+        Path of the written file
+    """
+    from ..agents.coaching_history_analyzer import CoachingFeedbackGenerator
+
+    if output_format not in ("parquet", "csv"):
+        raise ValueError(f"Unsupported output format: {output_format}")
+
+    if not output_path:
+        base = os.path.splitext(input_path)[0]
+        output_path = f"{base}.{output_format}"
+
+    df = CoachingFeedbackGenerator._read_excel_records(input_path)
+
+    if output_format == "parquet":
+        df.to_parquet(output_path, compression="zstd")
+    else:
+        df.to_csv(output_path, index=False)
+
+    logger.info(f"Wrote {len(df)} coaching records to {output_path}")
+    return output_path
+
+
+def main():
+    """Command-line entry point for the converter."""
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(
+        description="Convert a coaching details .xlsx file to Parquet or CSV"
+    )
+    parser.add_argument("input_path", help="Path to the source .xlsx file")
+    parser.add_argument(
+        "--output", default=None, help="Output path (defaults next to the input)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["parquet", "csv"],
+        default="parquet",
+        help="Output format (default: parquet)",
+    )
+    args = parser.parse_args()
+
+    output_path = convert_coaching_data(args.input_path, args.output, args.format)
+    print(f"Converted {args.input_path} -> {output_path}")
+
+
+if __name__ == "__main__":
+    main()